@@ -1,21 +1,49 @@
 """The google_maps integration."""
+import asyncio
 from datetime import timedelta
+from functools import partial
+
+import voluptuous as vol
 
 from homeassistant.components.device_tracker.config_entry import (
     DOMAIN as TRACKER_DOMAIN,
 )
 from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_SOURCE
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_SOURCE, CONF_USERNAME
+from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .config_flow import InvalidAuth, InvalidCookies, get_api
-from .const import COORDINATOR, DEFAULT_SCAN_INTERVAL, DOMAIN, LOGGER, UNLOADER
+from .config_flow import CannotConnect, InvalidAuth, InvalidCookies, get_api
+from .const import (
+    ATTR_CYCLES,
+    COORDINATOR,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    PROFILER,
+    SERVICE_PROFILE,
+    UNLOADER,
+)
+from .executor import async_acquire_executor, async_release_executor
+from .profiler import CycleProfiler
+
+SERVICE_PROFILE_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_CYCLES, default=1): vol.All(vol.Coerce(int), vol.Range(min=1))}
+)
 
 
 async def async_setup(hass, config):
     """Component doesn't support configuration through configuration.yaml."""
+    profiler = hass.data.setdefault(DOMAIN, {})[PROFILER] = CycleProfiler(hass)
+
+    async def _async_profile(call: ServiceCall):
+        """Profile the next update cycles."""
+        profiler.start(call.data[ATTR_CYCLES])
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile, schema=SERVICE_PROFILE_SCHEMA
+    )
     return True
 
 
@@ -31,12 +59,17 @@ async def async_setup_entry(hass, entry):
             )
         )
 
+    executor = async_acquire_executor(hass, entry.entry_id)
+    profiler = hass.data[DOMAIN][PROFILER]
+
     async def _async_update_data():
         """Fetch data from API endpoint."""
         try:
             people = {
                 person.id: person
-                for person in await hass.async_add_executor_job(api.get_all_people)
+                for person in await executor.async_run(
+                    entry.data[CONF_USERNAME], profiler.wrap(api.get_all_people)
+                )
             }
             if not people:
                 raise UpdateFailed("No data received")
@@ -45,23 +78,32 @@ async def async_setup_entry(hass, entry):
             _reauth_needed()
             coordinator._async_stop_refresh(None)
             raise UpdateFailed("Cookies expired") from e
+        except asyncio.TimeoutError as e:
+            raise UpdateFailed(
+                f"Timeout fetching data, queue depth {executor.queue_depth}"
+            ) from e
 
     try:
         api = await get_api(hass, entry.data)
     except InvalidAuth:
+        async_release_executor(hass, entry.entry_id)
         _reauth_needed()
         return False
+    except CannotConnect as err:
+        async_release_executor(hass, entry.entry_id)
+        raise ConfigEntryNotReady from err
     coordinator = DataUpdateCoordinator(
         hass,
         LOGGER,
         name="Google Maps",
-        update_method=_async_update_data,
+        update_method=partial(profiler.async_profile, _async_update_data),
         update_interval=timedelta(
             seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
         ),
     )
     await coordinator.async_refresh()
     if not coordinator.last_update_success:
+        async_release_executor(hass, entry.entry_id)
         raise ConfigEntryNotReady
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
@@ -87,4 +129,5 @@ async def async_unload_entry(hass, config_entry) -> bool:
 
     if unload_ok:
         [undo() for undo in hass.data[DOMAIN].pop(config_entry.entry_id)[UNLOADER]]
+        async_release_executor(hass, config_entry.entry_id)
     return unload_ok
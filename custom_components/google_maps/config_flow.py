@@ -1,4 +1,6 @@
 """Config flow for google_maps integration."""
+import asyncio
+from functools import partial
 from tempfile import NamedTemporaryFile
 from typing import Optional
 
@@ -11,7 +13,12 @@ from homeassistant.const import ATTR_GPS_ACCURACY, CONF_SCAN_INTERVAL, CONF_USER
 from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
 
-from .const import COOKIE, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import CALL_TIMEOUT, COOKIE, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .executor import (
+    async_acquire_executor,
+    async_get_executor,
+    async_release_executor,
+)
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -21,23 +28,43 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 STEP_AUTH_DATA_SCHEMA = vol.Schema({COOKIE: str})
 
 
-async def get_api(hass, data) -> Optional[Service]:
+class MapsService(Service):
+    """Service whose requests time out instead of pinning a worker."""
+
+    def _get_authenticated_session(self, cookies_file):
+        """Return the session, with a default timeout for every request."""
+        session = super()._get_authenticated_session(cookies_file)
+        session.request = partial(session.request, timeout=CALL_TIMEOUT)
+        return session
+
+
+def _create_service(cookie, username) -> MapsService:
+    """Create the Service from a temporary cookie file, in a worker thread."""
+    with NamedTemporaryFile() as cf:
+        cf.write(
+            "\n".join([lin for lin in cookie.split(sep=" ") if "\t" in lin]).encode(
+                "utf-8"
+            )
+        )
+        cf.flush()
+        return MapsService(cf.name, username)
+
+
+async def get_api(hass, data) -> Optional[MapsService]:
     """Get the Google Maps Api object."""
     username = data[CONF_USERNAME]
     cookie = data[COOKIE]
     try:
-        with NamedTemporaryFile() as cf:
-            cf.write(
-                "\n".join([lin for lin in cookie.split(sep=" ") if "\t" in lin]).encode(
-                    "utf-8"
-                )
-            )
-            return await hass.async_add_executor_job(Service, cf.name, username)
+        return await async_get_executor(hass).async_run(
+            username, _create_service, cookie, username
+        )
 
     except InvalidCookies as err:
         raise InvalidAuth(
             "Cookies invalid or expired. Provide new cookies to retry"
         ) from err
+    except asyncio.TimeoutError as err:
+        raise CannotConnect("Timeout while connecting to Google Maps") from err
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -82,6 +109,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
         user_input[CONF_USERNAME] = self._username
         errors = {}
+        async_acquire_executor(self.hass, self.flow_id)
         try:
             await get_api(self.hass, user_input)
             if self._reauth:
@@ -97,6 +125,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors["base"] = "cannot_connect"
         except (InvalidAuth, InvalidCookies):
             errors["base"] = "invalid_auth"
+        finally:
+            async_release_executor(self.hass, self.flow_id)
 
         return self.async_show_form(
             step_id="auth",
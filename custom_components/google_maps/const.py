@@ -13,3 +13,9 @@ ATTR_NICKNAME = "nickname"
 ATTR_ADDRESS_SHORT = "address_short"
 COORDINATOR = "coordinator"
 COOKIE = "cookie"
+EXECUTOR = "executor"
+MAX_WORKERS = 4
+CALL_TIMEOUT = 30
+PROFILER = "profiler"
+SERVICE_PROFILE = "profile"
+ATTR_CYCLES = "cycles"
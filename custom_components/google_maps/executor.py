@@ -0,0 +1,190 @@
+"""Dedicated worker pool for blocking Google Maps calls."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import callback
+
+from .const import CALL_TIMEOUT, DOMAIN, EXECUTOR, LOGGER, MAX_WORKERS
+
+
+class MapsExecutor:
+    """Run blocking locationsharinglib calls outside the shared executor.
+
+    Calls are serialized per key (an account) and bounded by a small thread
+    pool. A call waits at most the timeout for a free worker and then gets the
+    timeout again to finish once it has started. The pool stays alive while
+    it has users or a timed out call still occupies a worker.
+    """
+
+    def __init__(self, hass, max_workers=MAX_WORKERS, timeout=None):
+        """Initialize the worker pool."""
+        self._hass = hass
+        self._timeout = timeout or CALL_TIMEOUT
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=DOMAIN
+        )
+        self._locks = {}
+        self._running = {}
+        self._pending = set()
+        self._queued = 0
+        self._unsub_stop = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_stop
+        )
+        self._released = False
+        self.users = set()
+
+    @property
+    def queue_depth(self):
+        """Return the number of calls waiting for a free worker."""
+        return self._queued
+
+    @property
+    def busy(self):
+        """Return True if a call still occupies a worker."""
+        return any(not future.done() for future in self._running.values())
+
+    @callback
+    def _async_queue_changed(self, delta):
+        """Track and log the number of calls waiting for a worker."""
+        self._queued += delta
+        LOGGER.debug(f"Worker queue depth {self._queued}")
+
+    @callback
+    def _async_started(self, started):
+        """Account for a call picked up by a worker."""
+        self._async_queue_changed(-1)
+        started.set()
+
+    def _done(self, started, future):
+        """Hand a finished call back to the event loop, from any thread."""
+        if not self._hass.loop.is_closed():
+            self._hass.loop.call_soon_threadsafe(self._async_done, started, future)
+
+    @callback
+    def _async_done(self, started, future):
+        """Account for a finished call and shut down once unused."""
+        self._pending.discard(future)
+        if future.cancelled():
+            self._async_queue_changed(-1)
+            # Wake up a caller still waiting for a worker.
+            started.set()
+        self._async_shutdown_if_unused()
+
+    def _run(self, started, func, *args):
+        """Run a job inside a worker thread."""
+        self._hass.loop.call_soon_threadsafe(self._async_started, started)
+        return func(*args)
+
+    async def async_run(self, key, func, *args):
+        """Run func in the pool, one call at a time per key.
+
+        Raises asyncio.TimeoutError when no worker picks the call up in time,
+        or when it does not finish in time once started.
+        """
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            running = self._running.get(key)
+            if running is not None and not running.done():
+                # A timed out call still occupies a worker; don't stack another.
+                raise asyncio.TimeoutError(f"Previous call for {key} still running")
+
+            started = asyncio.Event()
+            future = self._executor.submit(self._run, started, func, *args)
+            self._pending.add(future)
+            self._async_queue_changed(1)
+            future.add_done_callback(partial(self._done, started))
+
+            try:
+                await asyncio.wait_for(started.wait(), self._timeout)
+            except asyncio.TimeoutError:
+                if future.cancel():
+                    LOGGER.warning(
+                        f"No worker available for {key} within {self._timeout} seconds"
+                    )
+                    raise
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            if future.cancelled():
+                raise asyncio.TimeoutError(f"Call for {key} cancelled at shutdown")
+
+            self._running[key] = future
+            try:
+                return await asyncio.wait_for(
+                    asyncio.wrap_future(future), self._timeout
+                )
+            except asyncio.TimeoutError:
+                LOGGER.warning(
+                    f"Call for {key} did not finish within {self._timeout} seconds"
+                )
+                raise
+
+    @callback
+    def async_release(self, user):
+        """Drop a user and shut the pool down once it is unused."""
+        self.users.discard(user)
+        self._released = True
+        self._async_shutdown_if_unused()
+
+    @callback
+    def _async_shutdown_if_unused(self):
+        """Shut down when no user is left and no call occupies a worker."""
+        if not self._released or self._unsub_stop is None:
+            return
+        if self.users or self.busy:
+            return
+        self._unsub_stop()
+        self._async_shutdown()
+
+    @callback
+    def _async_stop(self, _event):
+        """Shut down when Home Assistant stops."""
+        if self._unsub_stop is not None:
+            self._async_shutdown()
+
+    @callback
+    def _async_shutdown(self):
+        """Forget the pool and stop accepting work."""
+        self._unsub_stop = None
+        domain_data = self._hass.data.get(DOMAIN, {})
+        if domain_data.get(EXECUTOR) is self:
+            domain_data.pop(EXECUTOR)
+        self.shutdown()
+
+    def shutdown(self):
+        """Cancel queued calls and stop accepting work.
+
+        Worker threads are joined when the interpreter exits. Calls already
+        running are bounded by the request timeout of the Service session, so
+        they cannot hold up a stop or restart indefinitely.
+        """
+        for future in list(self._pending):
+            future.cancel()
+        self._executor.shutdown(wait=False)
+
+
+@callback
+def async_get_executor(hass):
+    """Return the integration's worker pool, creating it when needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if EXECUTOR not in domain_data:
+        domain_data[EXECUTOR] = MapsExecutor(hass)
+    return domain_data[EXECUTOR]
+
+
+@callback
+def async_acquire_executor(hass, user):
+    """Return the worker pool and keep it alive for a config entry or flow."""
+    executor = async_get_executor(hass)
+    executor.users.add(user)
+    return executor
+
+
+@callback
+def async_release_executor(hass, user):
+    """Release the worker pool; it shuts down once unused."""
+    executor = hass.data.get(DOMAIN, {}).get(EXECUTOR)
+    if executor is not None:
+        executor.async_release(user)
@@ -0,0 +1,128 @@
+"""Opt-in profiling of Google Maps poll cycles."""
+import cProfile
+from contextvars import ContextVar
+from itertools import count
+import pstats
+import sys
+import time
+
+from homeassistant.core import callback
+
+from .const import DOMAIN, LOGGER
+
+_CYCLE = ContextVar("google_maps_profile_cycle", default=None)
+
+
+class CycleProfiler:
+    """Profile a number of coordinator cycles and dump the aggregated stats.
+
+    The event loop is profiled from the start of the update method until its
+    listeners have been dispatched; blocking calls made by a profiled cycle
+    are profiled in the worker thread running them.
+    """
+
+    def __init__(self, hass):
+        """Initialize the profiler."""
+        self._hass = hass
+        self._cycles = 0
+        self._running = 0
+        self._loop_profile = None
+        self._worker_profiles = []
+        self._dumps = count()
+
+    def start(self, cycles):
+        """Profile the next cycles."""
+        LOGGER.info(f"Profiling the next {cycles} Google Maps update cycles")
+        if self._loop_profile is None:
+            self._loop_profile = cProfile.Profile()
+        self._cycles = cycles
+
+    def wrap(self, func):
+        """Return func, profiled in its worker thread if this cycle is profiled."""
+        cycle = _CYCLE.get()
+        if cycle is None:
+            return func
+
+        def _profiled(*args):
+            if sys.getprofile() is not None:
+                return func(*args)
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Python 3.12+ allows a single profiler, which covers all threads.
+                return func(*args)
+            try:
+                return func(*args)
+            finally:
+                profile.disable()
+                cycle.append(profile)
+
+        return _profiled
+
+    async def async_profile(self, target):
+        """Await the update method target, profiling it when cycles are pending."""
+        if not self._cycles:
+            return await target()
+
+        if not self._running:
+            if sys.getprofile() is not None:
+                self._async_cancel("another profiler is active")
+                return await target()
+            try:
+                self._loop_profile.enable()
+            except ValueError as err:
+                self._async_cancel(err)
+                return await target()
+        self._cycles -= 1
+        self._running += 1
+        cycle = []
+        token = _CYCLE.set(cycle)
+        try:
+            return await target()
+        finally:
+            _CYCLE.reset(token)
+            # The coordinator dispatches its listeners right after the update
+            # method returns, so end the cycle on the next loop iteration.
+            self._hass.loop.call_soon(self._async_end_cycle, cycle)
+
+    @callback
+    def _async_cancel(self, reason):
+        """Give up the profiling session."""
+        LOGGER.warning(f"Unable to profile Google Maps update cycles: {reason}")
+        self._cycles = 0
+        self._loop_profile = None
+        self._worker_profiles = []
+
+    @callback
+    def _async_end_cycle(self, cycle):
+        """Collect the worker profiles of a cycle and dump after the last one."""
+        # Worker calls outliving their cycle append to the list left behind.
+        self._worker_profiles.extend(cycle)
+        self._running -= 1
+        if self._running:
+            return
+        self._loop_profile.disable()
+        if not self._cycles:
+            profiles = [self._loop_profile, *self._worker_profiles]
+            self._loop_profile = None
+            self._worker_profiles = []
+            self._hass.async_create_task(self._async_dump(profiles))
+
+    async def _async_dump(self, profiles):
+        """Write the aggregated stats to the config directory."""
+        profiles = [profile for profile in profiles if profile.getstats()]
+        if not profiles:
+            LOGGER.warning("Google Maps profile is empty, nothing written")
+            return
+        path = self._hass.config.path(
+            f"{DOMAIN}.profile.{int(time.time())}.{next(self._dumps)}.cprof"
+        )
+        try:
+            await self._hass.async_add_executor_job(
+                lambda: pstats.Stats(*profiles).dump_stats(path)
+            )
+        except OSError as err:
+            LOGGER.error(f"Unable to write Google Maps profile to {path}: {err}")
+            return
+        LOGGER.info(f"Google Maps profile written to {path}")
@@ -1,10 +1,21 @@
 """Test the google_maps config flow."""
+from unittest.mock import patch
+
+from locationsharinglib import Service
+from requests import Session
+
 from homeassistant import config_entries, setup
 from homeassistant.components.google_maps.config_flow import (
     CannotConnect,
     InvalidCookies,
+    MapsService,
+)
+from homeassistant.components.google_maps.const import (
+    CALL_TIMEOUT,
+    COOKIE,
+    DOMAIN,
+    EXECUTOR,
 )
-from homeassistant.components.google_maps.const import COOKIE, DOMAIN
 from homeassistant.const import (
     ATTR_GPS_ACCURACY,
     CONF_SCAN_INTERVAL,
@@ -70,6 +81,7 @@ async def test_form_invalid_auth(hass, mock_service):
 
     assert result2["type"] == RESULT_TYPE_FORM
     assert result2["errors"] == {"base": "invalid_auth"}
+    assert EXECUTOR not in hass.data.get(DOMAIN, {})
 
 
 async def test_form_cannot_connect(hass, mock_service):
@@ -142,3 +154,11 @@ async def test_options_flow(hass, mock_service):
     assert result2["type"] == RESULT_TYPE_CREATE_ENTRY
     assert result2["data"][CONF_SCAN_INTERVAL] == 100
     assert result2["data"][ATTR_GPS_ACCURACY] is None
+
+
+def test_service_timeout():
+    """Test every request of the Service session gets a timeout."""
+    with patch.object(Service, "_get_authenticated_session", return_value=Session()):
+        session = MapsService.__new__(MapsService)._get_authenticated_session("")
+
+    assert session.request.keywords == {"timeout": CALL_TIMEOUT}
@@ -0,0 +1,161 @@
+"""Tests for the Google Maps worker pool."""
+import asyncio
+import logging
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.google_maps.const import DOMAIN, EXECUTOR
+from custom_components.google_maps.executor import (
+    MapsExecutor,
+    async_acquire_executor,
+    async_release_executor,
+)
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+
+
+async def test_executor_run(hass: HomeAssistant) -> None:
+    """Test a call is run in the worker pool."""
+    executor = MapsExecutor(hass)
+    assert await executor.async_run("key", sum, [1, 2]) == 3
+    assert executor.queue_depth == 0
+    executor.shutdown()
+
+
+async def test_executor_timeout(hass: HomeAssistant) -> None:
+    """Test a hung call times out and blocks further calls for the same key."""
+    executor = MapsExecutor(hass, timeout=0.1)
+    release = threading.Event()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await executor.async_run("key", release.wait)
+    with pytest.raises(asyncio.TimeoutError):
+        await executor.async_run("key", sum, [1, 2])
+    assert await executor.async_run("other", sum, [1, 2]) == 3
+
+    release.set()
+    await asyncio.wrap_future(executor._running["key"])
+    assert await executor.async_run("key", sum, [1, 2]) == 3
+    executor.shutdown()
+
+
+async def test_executor_queue_timeout(hass: HomeAssistant, caplog) -> None:
+    """Test a call waiting too long for a worker is dropped without running."""
+    caplog.set_level(logging.DEBUG)
+    executor = MapsExecutor(hass, max_workers=1, timeout=0.1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def _hang():
+        started.set()
+        release.wait()
+
+    hung = hass.async_create_task(executor.async_run("a", _hang))
+    await hass.async_add_executor_job(started.wait)
+
+    queued = Mock(return_value=3)
+    waiting = hass.async_create_task(executor.async_run("b", queued))
+    await asyncio.sleep(0)
+    assert executor.queue_depth == 1
+    assert "Worker queue depth 1" in caplog.text
+
+    with pytest.raises(asyncio.TimeoutError):
+        await waiting
+    with pytest.raises(asyncio.TimeoutError):
+        await hung
+    assert executor.queue_depth == 0
+
+    release.set()
+    await asyncio.wrap_future(executor._running["a"])
+    queued.assert_not_called()
+    assert await executor.async_run("b", queued) == 3
+    executor.shutdown()
+
+
+async def test_executor_shutdown(hass: HomeAssistant) -> None:
+    """Test a call refused after shutdown leaves the queue depth untouched."""
+    executor = MapsExecutor(hass)
+    executor.shutdown()
+
+    with pytest.raises(RuntimeError):
+        await executor.async_run("key", sum, [1, 2])
+    assert executor.queue_depth == 0
+
+
+async def test_executor_release(hass: HomeAssistant) -> None:
+    """Test the pool is only shut down when the last entry releases it."""
+    executor = async_acquire_executor(hass, "setting_up")
+    async_acquire_executor(hass, "loaded")
+
+    async_release_executor(hass, "loaded")
+    assert hass.data[DOMAIN][EXECUTOR] is executor
+    assert await executor.async_run("key", sum, [1, 2]) == 3
+
+    async_release_executor(hass, "setting_up")
+    assert EXECUTOR not in hass.data[DOMAIN]
+
+
+async def test_executor_release_busy(hass: HomeAssistant) -> None:
+    """Test a released pool survives a hung call so a retry cannot stack."""
+    executor = async_acquire_executor(hass, "entry")
+    release = threading.Event()
+    executor._timeout = 0.1
+
+    with pytest.raises(asyncio.TimeoutError):
+        await executor.async_run("key", release.wait)
+    async_release_executor(hass, "entry")
+    assert hass.data[DOMAIN][EXECUTOR] is executor
+
+    assert async_acquire_executor(hass, "entry") is executor
+    blocked = Mock()
+    with pytest.raises(asyncio.TimeoutError):
+        await executor.async_run("key", blocked)
+    blocked.assert_not_called()
+
+    async_release_executor(hass, "entry")
+    release.set()
+    await asyncio.wrap_future(executor._running["key"])
+    await hass.async_block_till_done()
+    assert EXECUTOR not in hass.data[DOMAIN]
+
+
+async def test_executor_stop_listener(hass: HomeAssistant) -> None:
+    """Test releasing the pool removes its stop listener."""
+    listeners = hass.bus.async_listeners().get(EVENT_HOMEASSISTANT_STOP, 0)
+    async_acquire_executor(hass, "entry")
+    assert hass.bus.async_listeners()[EVENT_HOMEASSISTANT_STOP] == listeners + 1
+
+    async_release_executor(hass, "entry")
+    assert hass.bus.async_listeners().get(EVENT_HOMEASSISTANT_STOP, 0) == listeners
+
+
+async def test_executor_stop(hass: HomeAssistant) -> None:
+    """Test stopping Home Assistant cancels queued calls and drops the pool."""
+    executor = hass.data.setdefault(DOMAIN, {})[EXECUTOR] = MapsExecutor(
+        hass, max_workers=1, timeout=10
+    )
+    started = threading.Event()
+    release = threading.Event()
+
+    def _hang():
+        started.set()
+        release.wait()
+
+    hung = hass.async_create_task(executor.async_run("a", _hang))
+    await hass.async_add_executor_job(started.wait)
+    queued = Mock()
+    waiting = hass.async_create_task(executor.async_run("b", queued))
+    await asyncio.sleep(0)
+    assert executor.queue_depth == 1
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    with pytest.raises(asyncio.TimeoutError):
+        await waiting
+    assert EXECUTOR not in hass.data[DOMAIN]
+    queued.assert_not_called()
+    assert executor.queue_depth == 0
+
+    release.set()
+    await hung
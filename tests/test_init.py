@@ -1,8 +1,18 @@
 """Tests for the Google Maps integration."""
 # from tests.async_mock import patch
+import asyncio
+from datetime import timedelta
+import glob
+import pstats
+import threading
 from unittest.mock import patch
 
 from homeassistant.components.google_maps.config_flow import DOMAIN, InvalidCookies
+from homeassistant.components.google_maps.const import (
+    DEFAULT_SCAN_INTERVAL,
+    EXECUTOR,
+    SERVICE_PROFILE,
+)
 from homeassistant.config_entries import (
     ENTRY_STATE_LOADED,
     ENTRY_STATE_NOT_LOADED,
@@ -12,8 +22,11 @@ from homeassistant.config_entries import (
 )
 from homeassistant.const import CONF_SOURCE
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .conftest import TEST_USERNAME, get_test_person, setup_entry
 
-from .conftest import setup_entry
+from tests.common import async_fire_time_changed
 
 
 async def test_config_entry_unload(hass: HomeAssistant, mock_service) -> None:
@@ -44,3 +57,52 @@ async def test_config_entry_reauth(hass: HomeAssistant, mock_service) -> None:
         mock_flow_init.assert_called_once_with(
             DOMAIN, context={CONF_SOURCE: SOURCE_REAUTH}, data=entry
         )
+
+
+async def test_config_entry_retry_timeout(hass: HomeAssistant, mock_service) -> None:
+    """Test a setup retry does not stack a call behind a hung first refresh."""
+    release = threading.Event()
+    mock_service[0].side_effect = None
+    mock_service[1].side_effect = lambda: release.wait() and [get_test_person()]
+    calls = mock_service[1].call_count
+
+    with patch("homeassistant.components.google_maps.executor.CALL_TIMEOUT", 0.1):
+        entry = await setup_entry(hass)
+        assert entry.state == ENTRY_STATE_SETUP_RETRY
+
+        await hass.config_entries.async_reload(entry.entry_id)
+        assert entry.state == ENTRY_STATE_SETUP_RETRY
+        assert mock_service[1].call_count == calls + 1
+
+        release.set()
+        executor = hass.data[DOMAIN][EXECUTOR]
+        await asyncio.wrap_future(executor._running[TEST_USERNAME])
+        await hass.config_entries.async_reload(entry.entry_id)
+        assert entry.state == ENTRY_STATE_LOADED
+
+    mock_service[1].side_effect = None
+
+
+async def test_profile_service(hass: HomeAssistant, mock_service, tmp_path) -> None:
+    """Test profiling a scheduled update cycle including listener dispatch."""
+    hass.config.config_dir = str(tmp_path)
+    mock_service[0].side_effect = None
+    mock_service[1].return_value = [get_test_person()]
+    entry = await setup_entry(hass)
+    await hass.async_block_till_done()
+    assert entry.state == ENTRY_STATE_LOADED
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_PROFILE, {"cycles": 1}, blocking=True
+    )
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+    )
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+
+    paths = glob.glob(hass.config.path(f"{DOMAIN}.profile.*.cprof"))
+    assert len(paths) == 1
+    functions = {function for _, _, function in pstats.Stats(paths[0]).stats}
+    assert "_handle_coordinator_update" in functions
+    assert "_mock_call" in functions
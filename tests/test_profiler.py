@@ -0,0 +1,118 @@
+"""Tests for the Google Maps cycle profiler."""
+import asyncio
+import cProfile
+import glob
+from unittest.mock import patch
+
+from custom_components.google_maps.const import DOMAIN
+from custom_components.google_maps.profiler import CycleProfiler
+from homeassistant.core import HomeAssistant
+
+
+async def _async_noop():
+    """Stand in for an update method."""
+
+
+def _dumps(hass):
+    """Return the profiles written to the config directory."""
+    return glob.glob(hass.config.path(f"{DOMAIN}.profile.*.cprof"))
+
+
+async def test_profiler_disabled(hass: HomeAssistant) -> None:
+    """Test nothing is profiled without a request."""
+    profiler = CycleProfiler(hass)
+
+    async def _update():
+        return profiler.wrap(sum)
+
+    assert await profiler.async_profile(_update) is sum
+
+
+async def test_profiler_cycles(hass: HomeAssistant, tmp_path) -> None:
+    """Test only calls made by profiled cycles are profiled."""
+    hass.config.config_dir = str(tmp_path)
+    profiler = CycleProfiler(hass)
+    profiler.start(1)
+    release = asyncio.Event()
+    wrapped = {}
+
+    async def _profiled():
+        wrapped["profiled"] = profiler.wrap(sum)
+        await release.wait()
+
+    async def _other():
+        wrapped["other"] = profiler.wrap(sum)
+
+    profiled = hass.async_create_task(profiler.async_profile(_profiled))
+    await asyncio.sleep(0)
+    await profiler.async_profile(_other)
+    assert wrapped["other"] is sum
+    assert wrapped["profiled"] is not sum
+
+    assert await hass.async_add_executor_job(wrapped["profiled"], [1, 2]) == 3
+    release.set()
+    await profiled
+    await hass.async_block_till_done()
+    assert len(_dumps(hass)) == 1
+
+    # A call outliving its cycle does not leak into a later session.
+    assert await hass.async_add_executor_job(wrapped["profiled"], [1, 2]) == 3
+    assert profiler._worker_profiles == []
+
+
+async def test_profiler_unique_dumps(hass: HomeAssistant, tmp_path) -> None:
+    """Test sessions in quick succession each write their own file."""
+    hass.config.config_dir = str(tmp_path)
+    profiler = CycleProfiler(hass)
+
+    for _ in range(2):
+        profiler.start(1)
+        await profiler.async_profile(_async_noop)
+        await hass.async_block_till_done()
+
+    assert len(_dumps(hass)) == 2
+
+
+async def test_profiler_dump_error(hass: HomeAssistant, tmp_path, caplog) -> None:
+    """Test a failing dump is logged and does not fail the cycle."""
+    hass.config.config_dir = str(tmp_path)
+    profiler = CycleProfiler(hass)
+    profiler.start(1)
+
+    with patch(
+        "custom_components.google_maps.profiler.pstats.Stats.dump_stats",
+        side_effect=OSError,
+    ):
+        await profiler.async_profile(_async_noop)
+        await hass.async_block_till_done()
+
+    assert "Unable to write Google Maps profile" in caplog.text
+    assert not _dumps(hass)
+
+
+async def test_profiler_other_profiler(hass: HomeAssistant, caplog) -> None:
+    """Test the session is cancelled instead of hijacking an active profiler."""
+    profiler = CycleProfiler(hass)
+    profiler.start(2)
+
+    with patch(
+        "custom_components.google_maps.profiler.sys.getprofile",
+        return_value=print,
+    ):
+        await profiler.async_profile(_async_noop)
+        await profiler.async_profile(_async_noop)
+    await hass.async_block_till_done()
+
+    assert caplog.text.count("Unable to profile Google Maps update cycles") == 1
+    assert not profiler._cycles
+
+
+async def test_profiler_empty_dump(hass: HomeAssistant, tmp_path, caplog) -> None:
+    """Test a profile without stats is skipped rather than failing the dump."""
+    hass.config.config_dir = str(tmp_path)
+    profiler = CycleProfiler(hass)
+
+    await profiler._async_dump([cProfile.Profile()])
+
+    assert "Google Maps profile is empty" in caplog.text
+    assert not _dumps(hass)